@@ -21,11 +21,13 @@ Typical Usage:
     app.run_interactive()
 """
 
+from datetime import datetime, timezone
+from itertools import chain
 from typing import List, Tuple
 
 from .core.scheduler import SimpleSpacedScheduler
 from .export.ics_exporter import ICSExporter
-from .models import ReviewItem, StudyItem, new_item
+from .models import ReviewItem, StudyItem, epoch_day, new_item
 from .storage.file_store import FileStore
 from .ui.interactive import interactive_loop
 
@@ -58,6 +60,23 @@ class App:
         self.scheduler = scheduler or SimpleSpacedScheduler()
         self.exporter = exporter or ICSExporter()
 
+    def __enter__(self) -> "App":
+        """Defer store writes until the surrounding ``with`` block exits.
+
+        Returns:
+            This App instance.
+        """
+        self.store.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Flush the store writes deferred inside the ``with`` block."""
+        self.store.__exit__(exc_type, exc, tb)
+
+    def flush(self) -> None:
+        """Write store changes deferred inside a ``with`` block right away."""
+        self.store.flush()
+
     def add_item(self, title: str, notes: str = "") -> StudyItem:
         """Create a new study item and generate its initial review schedule.
 
@@ -68,15 +87,12 @@ class App:
         Returns:
             The newly created StudyItem instance.
         """
+        if self.store.title_exists(title):
+            raise ValueError(f"An item with title '{title}' already exists.")
         item = new_item(title, notes)
-        items = {it.id: it for it in self.store.load_items()}
-        for it in items.values():
-            if it.title == title:
-                raise ValueError(f"An item with title '{title}' already exists.")
         self.store.save_item(item)
         reviews = self.scheduler.generate_initial(item)
-        for review in reviews:
-            self.store.save_review(review)
+        self.store.save_reviews(reviews)
         return item
 
     def list_items(self, due_only: bool = False) -> List[Tuple[StudyItem, ReviewItem]]:
@@ -88,17 +104,14 @@ class App:
         Returns:
             A list of tuples containing (StudyItem, ReviewItem).
         """
-        items = {it.id: it for it in self.store.load_items()}
-        reviews = self.store.load_reviews()
+        items, reviews = self.store.load_all()
         res = []
-        from datetime import datetime, timezone
-
-        now = datetime.now(timezone.utc)
+        today = epoch_day(datetime.now(timezone.utc))
         for review in reviews:
-            item_id, item = next(
-                (k, v) for k, v in items.items() if k == review.item_id
-            )
-            if due_only and review.review_date.date() != now.date():
+            item = items.get(review.item_id)
+            if item is None:
+                continue
+            if due_only and review.review_epoch_day != today:
                 continue
             res.append((item, review))
 
@@ -107,13 +120,17 @@ class App:
     def export_ics(self, path: str) -> None:
         """Export all scheduled reviews to an ICS calendar file.
 
+        Reviews are streamed from the store to the exporter rather than
+        loaded into a list first.
+
         Args:
             path: Destination file path for the generated ICS file.
         """
-        reviews = self.store.load_reviews()
-        if reviews:
-            items = {it.id: it for it in self.store.load_items()}
-            self.exporter.export(reviews, items, path)
+        reviews = self.store.iter_reviews()
+        first = next(reviews, None)
+        if first is not None:
+            items = self.store.load_items_by_id()
+            self.exporter.export(chain((first,), reviews), items, path)
             print(f"Exported: {path}")
         else:
             print("No reviews to export.")
@@ -133,3 +150,14 @@ class App:
             title: Title of the study item to remove.
         """
         self.store.remove_item_by_title(title)
+
+    def remove_items_by_title(self, title: str) -> int:
+        """Remove every study item with the given title and their reviews.
+
+        Args:
+            title: Title of the study items to remove.
+
+        Returns:
+            The number of study items removed.
+        """
+        return self.store.remove_items_by_title(title)
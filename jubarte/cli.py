@@ -10,12 +10,67 @@ It exposes two helpers:
   arguments, instantiates :class:`~.app.App` and dispatches the chosen
   subcommand.
 
+Each subcommand is bound to a ``_cmd_*`` handler through
+``set_defaults(func=...)``; handlers take ``(app, args)``.
+
 The CLI is intentionally small: the heavy lifting belongs to :class:`.app.App`.
 """
 
 import argparse
 
-from .app import App
+_PARSER = None
+
+
+def _cmd_add(app, args):
+    """Handle ``add``: create a study item and report its title."""
+    item = app.add_item(args.title, args.notes)
+    print(f"Added: {item.title}")
+
+
+def _cmd_interactive(app, args):
+    """Handle ``interactive``: start the REPL."""
+    app.run_interactive()
+
+
+def _cmd_export(app, args):
+    """Handle ``export``: write all reviews to an ``.ics`` file."""
+    app.export_ics(args.output)
+
+
+def _cmd_list(app, args):
+    """Handle ``list``: print items with their review dates in one write."""
+    items = app.list_items(due_only=args.due_today)
+    if items:
+        print(
+            "\n".join(
+                f"{it.title} | Review date: {review.review_date.isoformat()[:10]}"
+                for it, review in items
+            )
+        )
+    else:
+        print("No items found.")
+
+
+def _cmd_clear(app, args):
+    """Handle ``clear``: remove all items and reviews."""
+    app.clear()
+    print("Cleared all items and reviews.")
+
+
+def _cmd_remove(app, args):
+    """Handle ``remove``: remove every item matching the given title."""
+    removed = app.remove_items_by_title(args.title)
+    if not removed:
+        print(f"No item found with title: {args.title}")
+    else:
+        print(f"Removed {removed} item(s) with title: {args.title}")
+
+
+def _cmd_version(app, args):
+    """Handle ``version``: print the package version. ``app`` is unused."""
+    from . import __version__
+
+    print(__version__)
 
 
 def build_parser():
@@ -33,32 +88,47 @@ def build_parser():
       to items due today.
     - ``version``: print the package version and exit.
 
+    The parser is built on the first call and cached at module level, so
+    repeated in-process calls return the same instance.
+
     Returns:
         argparse.ArgumentParser: a ready-to-use parser instance.
     """
 
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
     jubarte_parser = argparse.ArgumentParser(prog="jubarte")
     sub_parsers = jubarte_parser.add_subparsers(dest="cmd")
 
     add = sub_parsers.add_parser("add", help="Add a new topic")
     add.add_argument("title", help="Title of the topic to add")
     add.add_argument("--notes", "-n", default="", help="Optional notes for the topic")
+    add.set_defaults(func=_cmd_add)
 
-    sub_parsers.add_parser("interactive", help="Interactive mode (REPL)")
+    interactive = sub_parsers.add_parser("interactive", help="Interactive mode (REPL)")
+    interactive.set_defaults(func=_cmd_interactive)
 
     exp = sub_parsers.add_parser("export", help="Export to .ics file")
     exp.add_argument("output", help="output .ics file")
+    exp.set_defaults(func=_cmd_export)
 
     list_p = sub_parsers.add_parser("list", help="List items")
     list_p.add_argument("--due-today", action="store_true", help="Only items due today")
+    list_p.set_defaults(func=_cmd_list)
 
-    sub_parsers.add_parser("clear", help="Clear all items and reviews")
+    clear = sub_parsers.add_parser("clear", help="Clear all items and reviews")
+    clear.set_defaults(func=_cmd_clear)
 
     remove = sub_parsers.add_parser("remove", help="Remove an item by title")
     remove.add_argument("title", help="Title of the item to remove")
+    remove.set_defaults(func=_cmd_remove)
 
-    sub_parsers.add_parser("version", help="Show version")
+    version = sub_parsers.add_parser("version", help="Show version")
+    version.set_defaults(func=_cmd_version)
 
+    _PARSER = jubarte_parser
     return jubarte_parser
 
 
@@ -67,9 +137,16 @@ def main(argv=None):
 
     This function builds the argument parser with :func:`build_parser`, parses
     the provided ``argv`` (a list of strings or ``None`` to read from
-    ``sys.argv``), creates an :class:`App` instance and executes the selected
-    command. Side effects include printing messages to stdout and writing an
-    output file when the ``export`` command is used.
+    ``sys.argv``), creates an :class:`App` instance and calls the handler that the
+    selected subcommand registered via ``set_defaults(func=...)``. Side
+    effects include printing messages to stdout and writing an output file
+    when the ``export`` command is used.
+
+    :class:`App` is imported only once a command that needs it is selected,
+    so ``version`` and the help output skip loading the storage, scheduler
+    and exporter modules. Except for ``interactive``, which manages deferred
+    writes itself, each command runs inside a ``with App()`` block, so the
+    store file is read at most once and written at most once per invocation.
 
     Args:
         argv (list[str] | None, optional): List of command-line arguments to
@@ -88,40 +165,20 @@ def main(argv=None):
 
     jubarte_parser = build_parser()
     parsed_user_args = jubarte_parser.parse_args(argv)
-    app = App()
-
-    if parsed_user_args.cmd == "add":
-        item = app.add_item(parsed_user_args.title, parsed_user_args.notes)
-        print(f"Added: {item.title}")
-    elif parsed_user_args.cmd == "interactive":
-        app.run_interactive()
-    elif parsed_user_args.cmd == "export":
-        app.export_ics(parsed_user_args.output)
-    elif parsed_user_args.cmd == "list":
-        items = app.list_items(due_only=parsed_user_args.due_today)
-        if items:
-            for it, review in items:
-                print(
-                    f"{it.title} | Review date: {review.review_date.isoformat()[:10]}"
-                )
-        else:
-            print("No items found.")
-    elif parsed_user_args.cmd == "version":
-        from . import __version__
-
-        print(__version__)
-    elif parsed_user_args.cmd == "clear":
-        app.clear()
-        print("Cleared all items and reviews.")
-    elif parsed_user_args.cmd == "remove":
-        items = app.list_items()
-        to_remove = [it for it, _ in items if it.title == parsed_user_args.title]
-        if not to_remove:
-            print(f"No item found with title: {parsed_user_args.title}")
-        else:
-            for it in to_remove:
-                app.remove_item(it.title)
-            print(f"Removed item(s) with title: {parsed_user_args.title}")
 
-    else:
+    handler = getattr(parsed_user_args, "func", None)
+    if handler is None:
         jubarte_parser.print_help()
+        return
+    if handler is _cmd_version:
+        handler(None, parsed_user_args)
+        return
+
+    from .app import App
+
+    if handler is _cmd_interactive:
+        handler(App(), parsed_user_args)
+        return
+
+    with App() as app:
+        handler(app, parsed_user_args)
@@ -18,10 +18,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, List
+from typing import List
 
-if TYPE_CHECKING:
-    from jubarte.models import ReviewItem, StudyItem
+from jubarte.models import ReviewItem, StudyItem
 
 
 class Scheduler(ABC):
@@ -53,9 +52,13 @@ class SimpleSpacedScheduler(Scheduler):
     This implementation generates review events using a predefined set
     of intervals measured in days. Each interval is added to the current
     UTC timestamp to determine future review dates.
+
+    BASE_DELTAS holds the same intervals as timedelta objects, built once
+    at import time.
     """
 
     BASE_INTERVALS = [1, 3, 7, 14, 30, 60, 120, 240, 360, 720]
+    BASE_DELTAS = tuple(timedelta(days=days) for days in BASE_INTERVALS)
 
     def generate_initial(self, item: "StudyItem") -> List["ReviewItem"]:
         """
@@ -63,7 +66,7 @@ class SimpleSpacedScheduler(Scheduler):
 
         The method calculates future review dates starting from the current
         UTC time and generates a ReviewItem for each interval defined in
-        BASE_INTERVALS.
+        BASE_INTERVALS, using the precomputed BASE_DELTAS.
 
         Args:
             item (StudyItem): The study item for which reviews will be scheduled.
@@ -72,18 +75,9 @@ class SimpleSpacedScheduler(Scheduler):
             List[ReviewItem]: A list of ReviewItem instances representing
                               scheduled future reviews.
         """
-        from jubarte.models import ReviewItem
-
         now = datetime.now(timezone.utc)
-        reviews: list[ReviewItem] = []
-
-        for days in self.BASE_INTERVALS:
-            review_date = now + timedelta(days=days)
-            reviews.append(
-                ReviewItem(
-                    item_id=item.id,
-                    review_date=review_date,
-                )
-            )
-
-        return reviews
+        item_id = item.id
+        return [
+            ReviewItem(item_id=item_id, review_date=now + delta)
+            for delta in self.BASE_DELTAS
+        ]
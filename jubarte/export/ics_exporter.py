@@ -23,15 +23,110 @@ Returns:
 from __future__ import annotations
 
 import os
+import re
 import tempfile
-import uuid
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, Mapping, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Sequence, Union
 
 if TYPE_CHECKING:
     from jubarte.models import ReviewItem, StudyItem
 
+_CALENDAR_HEADER_BYTES = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//jubarte//EN\r\n"
+_CALENDAR_FOOTER_BYTES = b"END:VCALENDAR\r\n"
+_FOLD_LIMIT = 75
+_FOLD_RE = re.compile(rf".{{1,{_FOLD_LIMIT}}}", re.DOTALL)
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "\n": r"\n", ",": r"\,", ";": r"\;"})
+
+
+def _escape_text(text: str) -> str:
+    """
+    Escape reserved characters according to iCalendar text rules.
+
+    Line endings are normalized to LF first; backslashes, newlines,
+    commas and semicolons are then escaped in a single ``str.translate``
+    pass using ``_ESCAPE_TABLE``.
+
+    Args:
+        text (str): Raw text to be escaped.
+
+    Returns:
+        str: Escaped text safe for inclusion in calendar fields.
+    """
+    if text is None:
+        return ""
+    s = str(text)
+    if "\r" in s:
+        s = s.replace("\r\n", "\n").replace("\r", "\n")
+    return s.translate(_ESCAPE_TABLE)
+
+
+def _fold_line(line: str, limit: int = _FOLD_LIMIT) -> str:
+    """
+    Apply line folding to comply with iCalendar line length limits.
+
+    Long lines are split by the precompiled ``_FOLD_RE`` pattern, so the
+    slicing runs inside the regex engine rather than in Python.
+
+    Args:
+        line (str): A single calendar line.
+        limit (int, optional): Maximum allowed line length before
+                               folding occurs. Defaults to 75.
+
+    Returns:
+        str: Line formatted with continuation prefixes when necessary.
+    """
+    if len(line) <= limit:
+        return line
+    if limit == _FOLD_LIMIT:
+        pattern = _FOLD_RE
+    else:
+        pattern = re.compile(rf".{{1,{limit}}}", re.DOTALL)
+    return "\r\n ".join(pattern.findall(line))
+
+
+def _format_vevent(
+    uid: str, dtstamp_line: str, dtstart: str, summary: str, description: str
+) -> str:
+    """
+    Format a single VEVENT block from plain string fields.
+
+    This is the per-event hot path of :meth:`ICSExporter.export`. It takes
+    only strings and does no attribute or method lookups on exporter or
+    model objects. The length check of :func:`_fold_line` is inlined so
+    short lines skip the call entirely, and DTSTART, whose length is fixed
+    well below the limit, is never folded.
+
+    Args:
+        uid (str): Unescaped event UID.
+        dtstamp_line (str): Preformatted, folded DTSTAMP line.
+        dtstart (str): Event start in YYYYMMDDTHHMMSSZ format.
+        summary (str): Unescaped event summary.
+        description (str): Unescaped event description.
+
+    Returns:
+        str: The CRLF-terminated VEVENT text.
+    """
+    uid_line = f"UID:{_escape_text(uid)}"
+    if len(uid_line) > _FOLD_LIMIT:
+        uid_line = _fold_line(uid_line)
+    summary_line = f"SUMMARY:{_escape_text(summary)}"
+    if len(summary_line) > _FOLD_LIMIT:
+        summary_line = _fold_line(summary_line)
+    description_line = f"DESCRIPTION:{_escape_text(description)}"
+    if len(description_line) > _FOLD_LIMIT:
+        description_line = _fold_line(description_line)
+    return (
+        "BEGIN:VEVENT\r\n"
+        f"{uid_line}\r\n"
+        f"{dtstamp_line}\r\n"
+        f"DTSTART:{dtstart}\r\n"
+        f"{summary_line}\r\n"
+        f"{description_line}\r\n"
+        "END:VEVENT\r\n"
+    )
+
 
 class ICSExporter:
     """
@@ -58,7 +153,13 @@ class ICSExporter:
 
         Reviews are sorted by their review_date attribute. Each review is
         converted into a VEVENT entry with metadata extracted from the
-        associated StudyItem when available.
+        associated StudyItem when available. Events are produced one at a
+        time by :meth:`_iter_vevents`, encoded to UTF-8 and streamed to a
+        binary file object with ``writelines``, so the whole calendar is
+        never held as one string and no text-mode encoder is involved. The
+        file is fsynced before it replaces the destination.
+        Event UIDs take their random suffix from one ``os.urandom`` buffer
+        sized for the whole export.
 
         Args:
             reviews (Iterable["ReviewItem"]): Collection of review entries
@@ -70,42 +171,22 @@ class ICSExporter:
         """
         path = Path(path)
         export_time = datetime.utcnow().replace(tzinfo=timezone.utc)
-        lines: list[str] = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//jubarte//EN",
-        ]
-
-        for r in sorted(reviews, key=lambda x: getattr(x, "review_date", datetime.min)):
-            item = items.get(r.item_id)
-            uid = f"{r.item_id}-{uuid.uuid4()}@jubarte"
-            dtstart = self._format_dt(r.review_date)
-            summary = f"Review: {item.title if item else r.item_id}"
-            description = item.notes if item else ""
-
-            vevent = [
-                "BEGIN:VEVENT",
-                self._fold(f"UID:{self._escape(uid)}"),
-                self._fold(f"DTSTAMP:{self._format_dt(export_time)}"),
-                self._fold(f"DTSTART:{dtstart}"),
-                self._fold(f"SUMMARY:{self._escape(summary)}"),
-                self._fold(f"DESCRIPTION:{self._escape(description)}"),
-                "END:VEVENT",
-            ]
-            lines.extend(vevent)
-
-        lines.append("END:VCALENDAR")
-
-        content = "\r\n".join(lines) + "\r\n"
+        dtstamp_line = self._fold(f"DTSTAMP:{self._format_dt(export_time)}")
+        ordered = sorted(reviews, key=attrgetter("review_date"))
 
         dirpath = path.parent
         dirpath.mkdir(parents=True, exist_ok=True)
-        fd, tmp_path = tempfile.mkstemp(
-            dir=str(dirpath), prefix=f".{path.name}.", text=True
-        )
+        fd, tmp_path = tempfile.mkstemp(dir=str(dirpath), prefix=f".{path.name}.")
         try:
-            with os.fdopen(fd, "w", encoding="utf-8", newline="") as tf:
-                tf.write(content)
+            with os.fdopen(fd, "wb") as tf:
+                tf.write(_CALENDAR_HEADER_BYTES)
+                tf.writelines(
+                    vevent.encode("utf-8")
+                    for vevent in self._iter_vevents(ordered, items, dtstamp_line)
+                )
+                tf.write(_CALENDAR_FOOTER_BYTES)
+                tf.flush()
+                os.fsync(tf.fileno())
             os.replace(tmp_path, str(path))
         finally:
             if os.path.exists(tmp_path):
@@ -114,6 +195,42 @@ class ICSExporter:
                 except Exception:
                     pass
 
+    def _iter_vevents(
+        self,
+        reviews: Sequence["ReviewItem"],
+        items: Mapping[str, "StudyItem"],
+        dtstamp_line: str,
+    ) -> Iterator[str]:
+        """
+        Yield one complete, CRLF-terminated VEVENT block per review.
+
+        Args:
+            reviews (Sequence["ReviewItem"]): Reviews to format, already in
+                export order.
+            items (Mapping[str, "StudyItem"]): Mapping of study item IDs
+                to StudyItem objects used to enrich event information.
+            dtstamp_line (str): Preformatted DTSTAMP line shared by all
+                events.
+
+        Yields:
+            str: The text of a single VEVENT, ready to be written.
+        """
+        uid_hex = os.urandom(16 * len(reviews)).hex()
+        # Bound once so the loop body uses local lookups only.
+        get_item = items.get
+        fmt = self._format_dt
+        format_vevent = _format_vevent
+
+        for i, r in enumerate(reviews):
+            item_id = r.item_id
+            item = get_item(item_id)
+            uid = f"{item_id}-{uid_hex[i * 32 : (i + 1) * 32]}@jubarte"
+            dtstart = fmt(r.review_date)
+            summary = f"Review: {item.title if item else item_id}"
+            description = item.notes if item else ""
+
+            yield format_vevent(uid, dtstamp_line, dtstart, summary, description)
+
     def _format_dt(self, dt: datetime) -> str:
         """
         Convert a datetime object into UTC iCalendar timestamp format.
@@ -138,26 +255,22 @@ class ICSExporter:
         """
         Escape reserved characters according to iCalendar text rules.
 
+        Delegates to the module-level :func:`_escape_text`.
+
         Args:
             text (str): Raw text to be escaped.
 
         Returns:
             str: Escaped text safe for inclusion in calendar fields.
         """
-        if text is None:
-            return ""
-        s = str(text)
-        s = s.replace("\\", "\\\\")
-        s = s.replace("\r\n", "\n").replace("\r", "\n")
-        s = s.replace("\n", r"\n")
-        s = s.replace(",", r"\,")
-        s = s.replace(";", r"\;")
-        return s
+        return _escape_text(text)
 
-    def _fold(self, line: str, limit: int = 75) -> str:
+    def _fold(self, line: str, limit: int = _FOLD_LIMIT) -> str:
         """
         Apply line folding to comply with iCalendar line length limits.
 
+        Delegates to the module-level :func:`_fold_line`.
+
         Args:
             line (str): A single calendar line.
             limit (int, optional): Maximum allowed line length before
@@ -166,7 +279,4 @@ class ICSExporter:
         Returns:
             str: Line formatted with continuation prefixes when necessary.
         """
-        if len(line) <= limit:
-            return line
-        parts = [line[i : i + limit] for i in range(0, len(line), limit)]
-        return "\r\n ".join(parts)
+        return _fold_line(line, limit)
@@ -6,14 +6,68 @@ This module defines lightweight data classes used by the Jubarte application:
 - ``ReviewItem``: represents a scheduled review for a study item (links an item
   id to a review date).
 
+Both classes are frozen, slotted dataclasses: instances have no per-instance
+``__dict__`` and cannot be modified after creation.
+
 Helper utilities for creating new items and (de)serializing instances to/from
 JSON-serializable dictionaries are also provided.
 """
 
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, Union
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_day(dt: datetime) -> int:
+    """Return the number of whole days between 1970-01-01 and ``dt``'s date.
+
+    The calendar date is taken in ``dt``'s own timezone, matching
+    ``dt.date()``, but no intermediate ``date`` object is created.
+
+    Args:
+        dt: The datetime to convert.
+
+    Returns:
+        int: Days since the Unix epoch.
+    """
+    return dt.toordinal() - _EPOCH_ORDINAL
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch.
+
+    Naive datetimes are interpreted as UTC. The conversion is exact.
+
+    Args:
+        dt: The datetime to convert.
+
+    Returns:
+        int: Microseconds since 1970-01-01T00:00:00Z.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: Union[int, str]) -> datetime:
+    """Rebuild a UTC datetime stored by :func:`_to_epoch_us`.
+
+    ISO 8601 strings written by earlier versions are still accepted.
+
+    Args:
+        value: Microseconds since the Unix epoch, or an ISO 8601 string.
+
+    Returns:
+        datetime: The corresponding datetime (UTC for integer input).
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _EPOCH + timedelta(microseconds=value)
 
 
 def _now_utc() -> datetime:
@@ -27,7 +81,7 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StudyItem:
     """A study/topic entry stored by the application.
 
@@ -46,8 +100,9 @@ class StudyItem:
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the StudyItem to a JSON-serializable dictionary.
 
-        The ``created_at`` field is converted to an ISO 8601 string using
-        ``datetime.isoformat()`` so the result can be stored in JSON files.
+        The ``created_at`` field is converted to integer microseconds since
+        the Unix epoch so the result can be stored in JSON files without
+        string formatting and parsing.
 
         Returns:
             Dict[str, Any]: Dictionary representation suitable for JSON.
@@ -56,54 +111,84 @@ class StudyItem:
             "id": self.id,
             "title": self.title,
             "notes": self.notes,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _to_epoch_us(self.created_at),
         }
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "StudyItem":
         """Create a StudyItem from a dictionary produced by :meth:`to_dict`.
 
-        The function expects ``created_at`` to be an ISO 8601 string. Missing
-        optional fields (e.g. ``notes``) use sensible defaults.
+        ``created_at`` may be integer epoch microseconds or, for data written
+        by earlier versions, an ISO 8601 string. Missing optional fields
+        (e.g. ``notes``) use sensible defaults.
 
         Args:
-            d: Dictionary with keys ``id``, ``title`` and ``created_at`` (ISO
-                string). ``notes`` is optional.
+            d: Dictionary with keys ``id``, ``title`` and ``created_at``
+                (epoch microseconds or ISO string). ``notes`` is optional.
 
         Returns:
             StudyItem: A new instance reconstructed from ``d``.
         """
         return StudyItem(
-            id=d["id"],
-            title=d["title"],
-            notes=d.get("notes", ""),
-            created_at=datetime.fromisoformat(d["created_at"]),
+            d["id"], d["title"], d.get("notes", ""), _from_epoch_us(d["created_at"])
         )
 
+    @classmethod
+    def _bulk_from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> Iterator["StudyItem"]:
+        """Yield StudyItems for many :meth:`to_dict` rows, bypassing ``__init__``.
+
+        Instances are allocated with ``object.__new__`` and their slots are
+        filled directly, skipping the generated ``__init__`` and its default
+        handling. Intended for bulk loads from storage.
+
+        Args:
+            rows: Dictionaries in the format accepted by :meth:`from_dict`.
 
-@dataclass
+        Yields:
+            StudyItem: One instance per row, in order.
+        """
+        new = object.__new__
+        set_attr = object.__setattr__
+        for d in rows:
+            obj = new(cls)
+            set_attr(obj, "id", d["id"])
+            set_attr(obj, "title", d["title"])
+            set_attr(obj, "notes", d.get("notes", ""))
+            set_attr(obj, "created_at", _from_epoch_us(d["created_at"]))
+            yield obj
+
+
+@dataclass(slots=True, frozen=True)
 class ReviewItem:
     """Represents a scheduled review for a study item.
 
     Attributes:
         item_id: The ``id`` of the associated :class:`StudyItem`.
         review_date: The date and time when the review should occur (UTC).
+        review_epoch_day: Day number of ``review_date`` (see :func:`epoch_day`),
+            computed at construction so date filters compare plain integers.
     """
 
     item_id: str
     review_date: datetime
+    review_epoch_day: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute ``review_epoch_day`` from ``review_date``."""
+        object.__setattr__(self, "review_epoch_day", epoch_day(self.review_date))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the ReviewItem to a JSON-serializable dictionary.
 
-        The ``review_date`` is converted to an ISO 8601 string.
+        The ``review_date`` is converted to integer microseconds since the
+        Unix epoch.
 
         Returns:
             Dict[str, Any]: Dictionary representation suitable for JSON.
         """
         return {
             "item_id": self.item_id,
-            "review_date": self.review_date.isoformat(),
+            "review_date": _to_epoch_us(self.review_date),
         }
 
     @staticmethod
@@ -111,16 +196,37 @@ class ReviewItem:
         """Create a ReviewItem from a dictionary produced by :meth:`to_dict`.
 
         Args:
-            d: Dictionary with keys ``item_id`` and ``review_date`` (ISO
-                string).
+            d: Dictionary with keys ``item_id`` and ``review_date`` (epoch
+                microseconds or ISO string).
 
         Returns:
             ReviewItem: A new instance reconstructed from ``d``.
         """
-        return ReviewItem(
-            item_id=d["item_id"],
-            review_date=datetime.fromisoformat(d["review_date"]),
-        )
+        return ReviewItem(d["item_id"], _from_epoch_us(d["review_date"]))
+
+    @classmethod
+    def _bulk_from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> Iterator["ReviewItem"]:
+        """Yield ReviewItems for many :meth:`to_dict` rows, bypassing ``__init__``.
+
+        Instances are allocated with ``object.__new__`` and their slots,
+        including ``review_epoch_day``, are filled directly. Intended for
+        bulk loads from storage.
+
+        Args:
+            rows: Dictionaries in the format accepted by :meth:`from_dict`.
+
+        Yields:
+            ReviewItem: One instance per row, in order.
+        """
+        new = object.__new__
+        set_attr = object.__setattr__
+        for d in rows:
+            review_date = _from_epoch_us(d["review_date"])
+            obj = new(cls)
+            set_attr(obj, "item_id", d["item_id"])
+            set_attr(obj, "review_date", review_date)
+            set_attr(obj, "review_epoch_day", epoch_day(review_date))
+            yield obj
 
 
 def new_item(title: str, notes: str = "") -> StudyItem:
@@ -10,18 +10,127 @@ stored records.
 The class supports conversion of file-based data into an in-memory
 MemoryStore instance for runtime operations.
 
+Changes are not written by rewriting the whole JSON file. Each mutation is
+appended as one line to a JSONL journal next to it (``data.json.journal``
+for ``data.json``), and the JSON file is only rewritten when the journal is
+compacted.
+
+When the optional ``orjson`` package is installed it is used for JSON
+parsing and serialization; otherwise the standard library ``json`` module
+is used. Both produce the same compact (unindented) UTF-8 file; indented
+files written by earlier versions are still read.
+
 Returns:
     None
 """
 
 import json
+import os
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import IO, Any, Dict, Iterator, List, Tuple
 
 from jubarte.models import ReviewItem, StudyItem
 
 from .memory_store import MemoryStore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# The journal is compacted into the JSON file once it is larger than both
+# _COMPACT_MIN_BYTES and _COMPACT_RATIO times the size of the JSON file.
+_COMPACT_MIN_BYTES = 64 * 1024
+_COMPACT_RATIO = 2
+
+
+# JSON helpers: _loads parses UTF-8 bytes, _dumps produces the compact
+# snapshot and _dumps_line a single newline-terminated journal line.
+# The implementation is chosen once here rather than on every call; with
+# orjson the helpers are the C functions themselves.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+    _dumps_line = partial(orjson.dumps, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    _loads = json.loads
+
+    def _dumps(data: Any) -> bytes:
+        """
+        Serialize data to compact UTF-8 JSON bytes.
+
+        Args:
+            data (Any): A JSON-serializable value.
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    def _dumps_line(data: Any) -> bytes:
+        """
+        Serialize data to a single newline-terminated line of UTF-8 JSON.
+
+        Args:
+            data (Any): A JSON-serializable value.
+
+        Returns:
+            bytes: The encoded JSON document followed by ``b"\\n"``.
+        """
+        line = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return (line + "\n").encode("utf-8")
+
+
+def _fsync_dir(path: Path) -> None:
+    """
+    Flush a directory's entries to disk so a rename or new file in it is durable.
+
+    Windows cannot open directories for syncing, so nothing is done there.
+
+    Args:
+        path (Path): The directory to sync.
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _file_mode(path: Path) -> int:
+    """
+    Return the permission bits for a file about to replace ``path``.
+
+    ``tempfile.mkstemp`` creates files readable by their owner only, so the
+    replacement is given the mode of the file it replaces, or for a new
+    file the default ``0o666`` less the umask that ``open`` would apply.
+
+    Args:
+        path (Path): The file being replaced.
+
+    Returns:
+        int: The permission bits to set.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
 
 class FileStore:
     """
@@ -35,6 +144,27 @@ class FileStore:
     It provides operations for saving, retrieving, deleting, and converting
     stored data while ensuring safe file writing through temporary file
     replacement.
+
+    In memory, the serialized records are indexed by identifier: items by
+    their ``id`` and reviews grouped by ``item_id``. Single-record updates
+    and lookups are dictionary operations; the flat JSON lists are only
+    rebuilt when the file is written.
+
+    Mutations are persisted by appending numbered operations to a JSONL
+    journal, so the bytes written per save depend on the size of the
+    change rather than of the whole data set. The current state is the
+    JSON snapshot with the journal replayed on top of it. Once the journal
+    outgrows the snapshot it is compacted: the snapshot is rewritten,
+    recording the last operation number it includes, and the journal is
+    truncated. Operations already contained in the snapshot are skipped on
+    replay, so a crash between the two steps does not apply them twice.
+
+    Several processes may share the files. Reloading, appending and
+    compacting happen under an exclusive ``flock`` on the journal. Before
+    appending, a store whose view is out of date reloads the files and
+    reapplies its queued operations on top, and operation numbers are only
+    assigned at that point. On platforms without ``fcntl`` no lock is
+    taken.
     """
 
     def __init__(self, path: str | Path = "data.json") -> None:
@@ -44,54 +174,387 @@ class FileStore:
         The directory is created if it does not exist. If the file is missing,
         an initial JSON structure with empty item and review lists is written.
 
+        The journal's name is the file's name with ``.journal`` appended, so
+        stores whose files differ only in their suffix get separate
+        journals.
+
         Args:
             path (str | Path, optional): Location of the JSON storage file.
                                          Defaults to "data.json".
+
+        Raises:
+            ValueError: If ``path`` itself ends in ``.journal`` and could
+                therefore be another store's journal.
         """
         self.path = Path(path)
+        if self.path.suffix == ".journal":
+            raise ValueError(f"{self.path} is named like a FileStore journal.")
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._item_rows: Dict[str, dict] = {}
+        self._review_rows: Dict[str, List[dict]] = {}
+        self._seq = 0
+        self._pending: List[dict] = []
+        self._loaded = False
+        self._cache_stamp: Tuple[int, int, int, int] | None = None
+        self._items_by_id: Dict[str, StudyItem] | None = None
+        self._title_index: Dict[str, List[str]] | None = None
+        self._deferred = 0
         if not self.path.exists():
+            # A journal without its snapshot is left over from a deleted
+            # data file; replaying it onto a fresh file would revive it.
+            self.journal_path.unlink(missing_ok=True)
             self._write({"items": [], "reviews": []})
 
-    def _read(self) -> Dict:
+    def __enter__(self) -> "FileStore":
+        """
+        Start deferring writes until the matching :meth:`__exit__`.
+
+        Mutations made inside the block only update the in-memory copy of
+        the data; their journal entries are appended in one write when the
+        outermost block exits.
+
+        Returns:
+            FileStore: This store instance.
+        """
+        self._deferred += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """
+        Leave a deferred-write block, flushing pending changes on the last exit.
+        """
+        self._deferred -= 1
+        if not self._deferred:
+            self.flush()
+
+    def _stamp(self) -> Tuple[int, int, int, int]:
+        """
+        Return the modification times (ns) and sizes of the storage files.
+
+        A missing journal is reported with a time and size of zero.
+
+        Returns:
+            Tuple[int, int, int, int]: ``(st_mtime_ns, st_size)`` of the
+                JSON file followed by the same pair for the journal.
+        """
+        st = self.path.stat()
+        try:
+            jst = self.journal_path.stat()
+        except FileNotFoundError:
+            return st.st_mtime_ns, st.st_size, 0, 0
+        return st.st_mtime_ns, st.st_size, jst.st_mtime_ns, jst.st_size
+
+    def _read(self) -> Tuple[Dict[str, dict], Dict[str, List[dict]]]:
+        """
+        Return the indexed records, loading the files only when they changed.
+
+        The indexes are kept in memory and updated in place by the mutating
+        methods. The files are reloaded with :meth:`_replay` only if their
+        modification times or sizes differ from when they were last read or
+        written, i.e. when another process changed them. Pending deferred
+        changes are never discarded.
+
+        Returns:
+            Tuple[Dict[str, dict], Dict[str, List[dict]]]: Serialized items
+                keyed by ``id`` and serialized reviews grouped by
+                ``item_id``.
+        """
+        if not self._pending:
+            if not self._loaded or self._stamp() != self._cache_stamp:
+                with self._locked():
+                    self._reload()
+        return self._item_rows, self._review_rows
+
+    @contextmanager
+    def _locked(self) -> Iterator[IO[bytes]]:
         """
-        Load and parse the JSON data from disk.
+        Hold an exclusive lock on the journal for the duration of the block.
+
+        The journal is opened (and created if missing) in append mode, and
+        the open file is yielded so appends go through the locked handle.
+        Without ``fcntl`` the file is opened but not locked.
+
+        Yields:
+            IO[bytes]: The journal, opened for appending.
+        """
+        with open(self.journal_path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _reload(self) -> None:
+        """
+        Replay the files into the indexes and drop the derived caches.
+
+        Must be called with the journal locked.
+        """
+        self._replay()
+        self._loaded = True
+        self._cache_stamp = self._stamp()
+        self._items_by_id = None
+        self._title_index = None
+
+    def _titles(self) -> Dict[str, List[str]]:
+        """
+        Return the index of item identifiers by title.
+
+        The index is built from the serialized items on first use, kept up
+        to date by :meth:`save_item` and the removal methods, and discarded
+        when the files are reloaded.
 
         Returns:
-            Dict: The full JSON content containing stored items and reviews.
+            Dict[str, List[str]]: Mapping of titles to the IDs of the items
+                                  carrying them, in storage order.
         """
-        with self.path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        items, _ = self._read()
+        if self._title_index is None:
+            index: Dict[str, List[str]] = {}
+            for iid, it in items.items():
+                index.setdefault(it.get("title"), []).append(iid)
+            self._title_index = index
+        return self._title_index
+
+    def _replay(self) -> None:
+        """
+        Rebuild the indexes from the JSON snapshot and the journal.
+
+        The journal is read line by line, so only one operation is decoded
+        at a time. Operations numbered at or below the snapshot's ``seq``
+        are already part of it and are skipped. A trailing line that is
+        incomplete or not valid JSON is the remains of an interrupted append;
+        it is cut off so later appends start on a clean line. As appends
+        happen under the journal lock, which the caller holds, such a line
+        cannot belong to an append still in progress.
+
+        Item identifiers are interned as the rows are indexed, so each ID is
+        held once no matter how many reviews refer to it.
+        """
+        intern = sys.intern
+        d = _loads(self.path.read_bytes())
+        self._item_rows = {}
+        for it in d.get("items", []):
+            it["id"] = iid = intern(it["id"])
+            self._item_rows[iid] = it
+        self._review_rows = {}
+        for r in d.get("reviews", []):
+            r["item_id"] = iid = intern(r["item_id"])
+            self._review_rows.setdefault(iid, []).append(r)
+        self._seq = base_seq = d.get("seq", 0)
+
+        if not self.journal_path.exists():
+            return
+        good = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    op = _loads(line)
+                except ValueError:
+                    break
+                good += len(line)
+                if op["seq"] > base_seq:
+                    self._apply(op)
+                    self._seq = op["seq"]
+            torn = good != f.tell()
+        if torn:
+            os.truncate(self.journal_path, good)
+
+    def _apply(self, op: dict) -> None:
+        """
+        Apply one journal operation to the in-memory indexes.
+
+        Args:
+            op (dict): The operation, with its ``op`` name and the fields
+                that operation needs.
+        """
+        kind = op["op"]
+        if kind == "save_item":
+            row = op["data"]
+            row["id"] = iid = sys.intern(row["id"])
+            self._item_rows.pop(iid, None)
+            self._item_rows[iid] = row
+        elif kind == "save_review":
+            row = op["data"]
+            row["item_id"] = iid = sys.intern(row["item_id"])
+            self._review_rows.setdefault(iid, []).append(row)
+        elif kind == "remove_item":
+            self._item_rows.pop(op["id"], None)
+            self._review_rows.pop(op["id"], None)
+        elif kind == "remove_reviews":
+            self._review_rows.pop(op["item_id"], None)
+        elif kind == "clear":
+            self._item_rows = {}
+            self._review_rows = {}
+
+    def _record(self, kind: str, **fields: Any) -> None:
+        """
+        Apply an operation to the indexes and queue it for the journal.
+
+        The operation is numbered later, by :meth:`flush`.
+
+        Args:
+            kind (str): Operation name, as understood by :meth:`_apply`.
+            **fields (Any): The operation's fields.
+        """
+        op = {"op": kind, **fields}
+        self._apply(op)
+        self._pending.append(op)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Build the on-disk JSON structure from the in-memory indexes.
+
+        Returns:
+            Dict[str, Any]: ``{"seq": n, "items": [...], "reviews": [...]}``,
+                where ``seq`` is the number of the last operation included.
+        """
+        return {
+            "seq": self._seq,
+            "items": list(self._item_rows.values()),
+            "reviews": [r for rows in self._review_rows.values() for r in rows],
+        }
 
     def _write(self, data: Dict) -> None:
         """
         Write structured data safely to the JSON file.
 
-        Data is first written to a temporary file and then atomically
-        replaces the original file to reduce the risk of corruption.
+        Data is first written to a uniquely named temporary file in the same
+        directory, flushed to disk with ``os.fsync``, and then atomically
+        replaces the original file to reduce the risk of corruption. The
+        directory is fsynced after the rename so the replacement itself
+        survives a crash. Unique names keep concurrent writers from
+        clobbering each other's temporary file. The temporary file gets the
+        permissions of the file it replaces (see :func:`_file_mode`).
 
         Args:
             data (Dict): The complete data structure to be written.
         """
-        tmp = self.path.with_suffix(".tmp")
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        tmp.replace(self.path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(self.path.parent), prefix=f".{self.path.name}."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), _file_mode(self.path))
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, str(self.path))
+            _fsync_dir(self.path.parent)
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except Exception:
+                    pass
+        self._cache_stamp = self._stamp()
+
+    def _append(self, journal: IO[bytes], ops: List[dict]) -> None:
+        """
+        Append operations to the journal and flush them to disk.
+
+        All lines are written with a single call, and the journal is
+        fsynced before returning. This is the only sync needed per save;
+        the directory is synced as well when the journal starts out empty,
+        in case the file was just created. Must be called with the journal
+        locked.
+
+        Args:
+            journal (IO[bytes]): The locked journal from :meth:`_locked`.
+            ops (List[dict]): The numbered operations to append, in order.
+        """
+        created = os.fstat(journal.fileno()).st_size == 0
+        journal.write(b"".join(map(_dumps_line, ops)))
+        journal.flush()
+        os.fsync(journal.fileno())
+        if created:
+            _fsync_dir(self.path.parent)
+        self._cache_stamp = self._stamp()
+
+    def _compact(self) -> None:
+        """
+        Fold the journal into the JSON snapshot and truncate the journal.
+
+        Must be called with the journal locked and the indexes up to date
+        with the files, as :meth:`flush` ensures.
+        """
+        self._write(self._snapshot())
+        os.truncate(self.journal_path, 0)
+        self._cache_stamp = self._stamp()
+
+    def _save(self) -> None:
+        """
+        Persist queued operations.
+
+        Inside a deferred-write block the operations stay queued and are
+        written later by :meth:`flush`.
+        """
+        if not self._deferred:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Append pending operations to the journal, if any.
+
+        With the journal locked, the files are first checked against the
+        stamp from the last read or write. If another process changed them
+        in the meantime, they are replayed and the pending operations are
+        applied again on top, so that process's changes are neither missed
+        nor overwritten. The operations are then numbered after the last
+        one on disk and appended.
+
+        The journal is compacted afterwards when it has grown larger than
+        the snapshot by the configured ratio.
+        """
+        if not self._pending:
+            return
+        with self._locked() as journal:
+            if self._stamp() != self._cache_stamp:
+                self._reload()
+                for op in self._pending:
+                    self._apply(op)
+            for op in self._pending:
+                self._seq += 1
+                op["seq"] = self._seq
+            self._append(journal, self._pending)
+            self._pending = []
+            _, snapshot_size, _, journal_size = self._cache_stamp
+            if journal_size > max(_COMPACT_MIN_BYTES, _COMPACT_RATIO * snapshot_size):
+                self._compact()
 
     def save_item(self, item: StudyItem) -> None:
         """
         Insert or update a StudyItem in the storage file.
 
         If an item with the same identifier already exists, it is replaced.
+        Saving an item identical to the stored one is a no-op: nothing is
+        journaled and the item keeps its position.
 
         Args:
             item (StudyItem): The study item to be stored.
         """
-        d = self._read()
-        items = [it for it in d.get("items", []) if it.get("id") != item.id]
-        items.append(item.to_dict())
-        d["items"] = items
-        self._write(d)
+        items, _ = self._read()
+        old = items.get(item.id)
+        row = item.to_dict()
+        if old == row:
+            return
+        self._record("save_item", data=row)
+        if self._title_index is not None:
+            if old is not None:
+                ids = self._title_index[old.get("title")]
+                ids.remove(item.id)
+                if not ids:
+                    del self._title_index[old.get("title")]
+            self._title_index.setdefault(item.title, []).append(item.id)
+        if self._items_by_id is not None:
+            self._items_by_id.pop(item.id, None)
+            self._items_by_id[item.id] = item
+        self._save()
 
     def load_items(self) -> List[StudyItem]:
         """
@@ -101,8 +564,42 @@ class FileStore:
             List[StudyItem]: A list of StudyItem instances reconstructed
                              from serialized data.
         """
-        d = self._read()
-        return [StudyItem.from_dict(it) for it in d.get("items", [])]
+        return list(self.load_items_by_id().values())
+
+    def load_items_by_id(self) -> Dict[str, StudyItem]:
+        """
+        Retrieve all StudyItem objects keyed by their identifier.
+
+        The mapping is built on first use and kept up to date by
+        :meth:`save_item`; removals discard it so it is rebuilt on the next
+        call. The cached dictionary itself is returned and must be treated
+        as read-only.
+
+        Returns:
+            Dict[str, StudyItem]: Mapping of study item IDs to StudyItem
+                                  instances.
+        """
+        items, _ = self._read()
+        if self._items_by_id is None:
+            self._items_by_id = {
+                it.id: it for it in StudyItem._bulk_from_dicts(items.values())
+            }
+        return self._items_by_id
+
+    def title_exists(self, title: str) -> bool:
+        """
+        Check whether a StudyItem with the given title is stored.
+
+        The title index is consulted, so no StudyItem objects are
+        constructed and, once the index is built, no records are scanned.
+
+        Args:
+            title (str): Title to look for.
+
+        Returns:
+            bool: True if an item with this title exists; otherwise False.
+        """
+        return title in self._titles()
 
     def save_review(self, review: ReviewItem) -> None:
         """
@@ -111,11 +608,23 @@ class FileStore:
         Args:
             review (ReviewItem): The review entry to be serialized and stored.
         """
-        d = self._read()
-        reviews = d.get("reviews", [])
-        reviews.append(review.to_dict())
-        d["reviews"] = reviews
-        self._write(d)
+        self.save_reviews([review])
+
+    def save_reviews(self, reviews: List[ReviewItem]) -> None:
+        """
+        Append several ReviewItem records to storage in a single write.
+
+        The journal entries for all reviews are appended with a single
+        write, instead of once per review.
+
+        Args:
+            reviews (List[ReviewItem]): The review entries to be serialized
+                                        and stored.
+        """
+        self._read()
+        for review in reviews:
+            self._record("save_review", data=review.to_dict())
+        self._save()
 
     def load_reviews(self) -> List[ReviewItem]:
         """
@@ -125,8 +634,34 @@ class FileStore:
             List[ReviewItem]: A list of ReviewItem instances reconstructed
                               from serialized data.
         """
-        d = self._read()
-        return [ReviewItem.from_dict(r) for r in d.get("reviews", [])]
+        return list(self.iter_reviews())
+
+    def iter_reviews(self) -> Iterator[ReviewItem]:
+        """
+        Yield stored ReviewItem objects one at a time.
+
+        Unlike :meth:`load_reviews`, no list of ReviewItem instances is
+        built, so callers that consume reviews sequentially keep only one
+        object alive at a time.
+
+        Yields:
+            ReviewItem: Each stored review, grouped by study item.
+        """
+        _, reviews = self._read()
+        for rows in reviews.values():
+            yield from ReviewItem._bulk_from_dicts(rows)
+
+    def load_all(self) -> Tuple[Dict[str, StudyItem], List[ReviewItem]]:
+        """
+        Retrieve all StudyItem and ReviewItem objects with a single read.
+
+        The item mapping is the cached one from :meth:`load_items_by_id`.
+
+        Returns:
+            Tuple[Dict[str, StudyItem], List[ReviewItem]]: A mapping of study
+                item IDs to StudyItem instances and the list of all reviews.
+        """
+        return self.load_items_by_id(), self.load_reviews()
 
     def load_review_for_item(self, item_id: str) -> ReviewItem | None:
         """
@@ -139,68 +674,98 @@ class FileStore:
             ReviewItem | None: The matching ReviewItem if found;
                                otherwise None.
         """
-        for r in self.load_reviews():
-            if r.item_id == item_id:
-                return r
-        return None
+        _, reviews = self._read()
+        rows = reviews.get(item_id)
+        return ReviewItem.from_dict(rows[0]) if rows else None
 
     def clear(self) -> None:
         """
         Remove all stored items and reviews.
 
-        The JSON file is reset to its initial empty structure.
+        Operations still queued in a deferred-write block are dropped, as
+        the clear supersedes them. Nothing is journaled if the store is
+        already empty with nothing queued.
         """
-        self._write({"items": [], "reviews": []})
-
-    def remove_reviews_for_item(self, item_id: str) -> Dict[str, List[dict]]:
+        items, reviews = self._read()
+        if not items and not reviews and not self._pending:
+            return
+        self._pending = []
+        self._record("clear")
+        self._title_index = {}
+        self._items_by_id = None
+        self._save()
+
+    def remove_reviews_for_item(self, item_id: str) -> None:
         """
         Delete all review records associated with a given study item.
 
         Args:
             item_id (str): Identifier of the study item whose reviews
-                           should be removed.
-
-        Returns:
-            Dict[str, List[dict]]: The updated data structure after
-                                   removal of the reviews.
+                           should be removed. Nothing is journaled if the
+                           item has no reviews.
         """
-        d = self._read()
-        reviews = [r for r in d.get("reviews", []) if r.get("item_id") != item_id]
-        d["reviews"] = reviews
-        self._write(d)
-        return d
+        _, reviews = self._read()
+        if item_id not in reviews:
+            return
+        self._record("remove_reviews", item_id=item_id)
+        self._save()
 
     def remove_item_by_title(self, title: str) -> None:
         """
         Remove a study item by its title and delete associated reviews.
 
+        Items and reviews are removed in a single pass via
+        :meth:`remove_items_by_title`; the reviews of every matching item are
+        dropped, not only those of the first match.
+
         Args:
             title (str): Title of the study item to be removed.
         """
-        d = self._read()
-        item_id = ""
-        for item in d["items"]:
-            if item["title"] == title:
-                item_id = item["id"]
-                break
-        d = self.remove_reviews_for_item(item_id=item_id)
-        items = [it for it in d.get("items", []) if it.get("title") != title]
-        d["items"] = items
-        self._write(d)
+        self.remove_items_by_title(title)
+
+    def remove_items_by_title(self, title: str) -> int:
+        """
+        Remove every study item with the given title and all their reviews.
+
+        The matching items are found through the title index instead of a
+        scan, and the journal entries for all removals are appended with a
+        single write.
+
+        Args:
+            title (str): Title of the study items to be removed.
+
+        Returns:
+            int: The number of study items removed.
+        """
+        removed_ids = self._titles().pop(title, None)
+        if not removed_ids:
+            return 0
+        for iid in removed_ids:
+            self._record("remove_item", id=iid)
+        self._items_by_id = None
+        self._save()
+        return len(removed_ids)
 
     def as_memory(self) -> MemoryStore:
         """
         Convert file-based data into an in-memory MemoryStore instance.
 
-        All stored StudyItem and ReviewItem objects are loaded from disk
-        and inserted into a new MemoryStore object.
+        The MemoryStore's dictionaries are built directly from the indexes
+        loaded by a single :meth:`_read`, rather than through one
+        ``save_item``/``save_review`` call per record. MemoryStore keeps one
+        review per item, so only the last stored review of each item is
+        constructed, the one repeated ``save_review`` calls would have kept.
 
         Returns:
             MemoryStore: A populated in-memory representation of the data.
         """
+        _, reviews = self._read()
         ms = MemoryStore()
-        for it in self.load_items():
-            ms.save_item(it)
-        for r in self.load_reviews():
-            ms.save_review(r)
+        ms._items = dict(self.load_items_by_id())
+        ms._reviews = {
+            r.item_id: r
+            for r in ReviewItem._bulk_from_dicts(
+                rows[-1] for rows in reviews.values() if rows
+            )
+        }
         return ms
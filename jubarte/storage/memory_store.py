@@ -10,7 +10,7 @@ Returns:
     None
 """
 
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from jubarte.models import ReviewItem, StudyItem
 
@@ -39,6 +39,25 @@ class MemoryStore:
         self._items: Dict[str, StudyItem] = {}
         self._reviews: Dict[str, ReviewItem] = {}
 
+    def __enter__(self) -> "MemoryStore":
+        """
+        Enter a deferred-write block. Provided for parity with FileStore.
+
+        Returns:
+            MemoryStore: This store instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """
+        Leave a deferred-write block. Nothing needs to be flushed.
+        """
+
+    def flush(self) -> None:
+        """
+        Persist pending changes. A no-op, as nothing is stored outside memory.
+        """
+
     def save_item(self, item: StudyItem) -> None:
         """
         Store or update a StudyItem in memory.
@@ -59,6 +78,56 @@ class MemoryStore:
         """
         return list(self._items.values())
 
+    def load_items_by_id(self) -> Dict[str, StudyItem]:
+        """
+        Retrieve all stored study items keyed by their identifier.
+
+        The internal dictionary is returned directly and must be treated as
+        read-only.
+
+        Returns:
+            Dict[str, StudyItem]: Mapping of study item IDs to StudyItem
+                                  instances.
+        """
+        return self._items
+
+    def title_exists(self, title: str) -> bool:
+        """
+        Check whether a StudyItem with the given title is stored.
+
+        Args:
+            title (str): Title to look for.
+
+        Returns:
+            bool: True if an item with this title exists; otherwise False.
+        """
+        return any(it.title == title for it in self._items.values())
+
+    def remove_item_by_title(self, title: str) -> None:
+        """
+        Remove a study item by its title together with its review.
+
+        Args:
+            title (str): Title of the study item to be removed.
+        """
+        self.remove_items_by_title(title)
+
+    def remove_items_by_title(self, title: str) -> int:
+        """
+        Remove every study item with the given title and their reviews.
+
+        Args:
+            title (str): Title of the study items to be removed.
+
+        Returns:
+            int: The number of study items removed.
+        """
+        removed_ids = [iid for iid, it in self._items.items() if it.title == title]
+        for iid in removed_ids:
+            del self._items[iid]
+            self._reviews.pop(iid, None)
+        return len(removed_ids)
+
     def save_review(self, review: ReviewItem) -> None:
         """
         Store or update a ReviewItem associated with a study item.
@@ -69,6 +138,19 @@ class MemoryStore:
         """
         self._reviews[review.item_id] = review
 
+    def save_reviews(self, reviews: Iterable[ReviewItem]) -> None:
+        """
+        Store or update several ReviewItem records at once.
+
+        Args:
+            reviews (Iterable[ReviewItem]): The review data to be stored,
+                                            each linked to a study item via
+                                            item_id. Any iterable, including
+                                            a generator, is accepted.
+        """
+        for review in reviews:
+            self._reviews[review.item_id] = review
+
     def load_reviews(self) -> List[ReviewItem]:
         """
         Retrieve all stored review records.
@@ -79,6 +161,25 @@ class MemoryStore:
         """
         return list(self._reviews.values())
 
+    def iter_reviews(self) -> Iterator[ReviewItem]:
+        """
+        Yield stored review records one at a time.
+
+        Yields:
+            ReviewItem: Each ReviewItem currently stored in memory.
+        """
+        yield from self._reviews.values()
+
+    def load_all(self) -> Tuple[Dict[str, StudyItem], List[ReviewItem]]:
+        """
+        Retrieve all stored study items and review records together.
+
+        Returns:
+            Tuple[Dict[str, StudyItem], List[ReviewItem]]: A mapping of study
+                item IDs to StudyItem instances and the list of all reviews.
+        """
+        return self._items, list(self._reviews.values())
+
     def load_review_for_item(self, item_id: str) -> ReviewItem | None:
         """
         Retrieve the review associated with a specific study item.
@@ -0,0 +1,320 @@
+"""
+SQLite-backed storage module for study and review data.
+
+This module defines the SQLiteStore class, an alternative to FileStore that
+keeps StudyItem and ReviewItem records in an SQLite database instead of a
+single JSON document. Each mutation is an individual INSERT or DELETE, so
+saving a record no longer rewrites the whole data set, and lookups by item
+or title use indexes.
+
+SQLiteStore exposes the same public methods as FileStore and can be passed
+to :class:`~jubarte.app.App` as its ``store``.
+
+Returns:
+    None
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from jubarte.models import ReviewItem, StudyItem
+
+from .memory_store import MemoryStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_title ON items (title);
+CREATE TABLE IF NOT EXISTS reviews (
+    item_id TEXT NOT NULL,
+    review_date INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_item_id ON reviews (item_id);
+"""
+
+# Columns holding item identifiers, interned as rows are read.
+_ID_COLUMNS = frozenset(("id", "item_id"))
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    Row factory returning rows as dictionaries keyed by column name.
+
+    The dictionaries have the same shape as the ``to_dict`` output of the
+    models, so they can be passed straight to ``from_dict``. Identifier
+    columns are interned, as FileStore does when it indexes its rows, so an
+    item's ``id`` and the ``item_id`` of its reviews share one string object.
+
+    Args:
+        cursor (sqlite3.Cursor): The cursor that produced the row.
+        row (Tuple[Any, ...]): The raw row values.
+
+    Returns:
+        Dict[str, Any]: Mapping of column names to values.
+    """
+    intern = sys.intern
+    return {
+        name: intern(value) if name in _ID_COLUMNS else value
+        for (name, *_), value in zip(cursor.description, row)
+    }
+
+
+class SQLiteStore:
+    """
+    SQLite persistence layer for StudyItem and ReviewItem objects.
+
+    The database holds two tables mirroring FileStore's JSON collections:
+    - ``items``: one row per StudyItem, keyed by ``id``.
+    - ``reviews``: one row per ReviewItem, indexed by ``item_id``.
+
+    The connection runs in autocommit mode with WAL journaling. Used as a
+    context manager, the store wraps the enclosed operations in a single
+    transaction, like FileStore's deferred-write blocks. Unlike FileStore,
+    a block that raises is rolled back rather than written.
+    """
+
+    def __init__(self, path: str | Path = "data.sqlite3") -> None:
+        """
+        Open (and if needed create) the SQLite database at ``path``.
+
+        Args:
+            path (str | Path, optional): Location of the database file.
+                                         Defaults to "data.sqlite3".
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None)
+        self._conn.row_factory = _dict_row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._deferred = 0
+
+    def __enter__(self) -> "SQLiteStore":
+        """
+        Start a transaction that lasts until the matching :meth:`__exit__`.
+
+        Returns:
+            SQLiteStore: This store instance.
+        """
+        if not self._deferred:
+            self._conn.execute("BEGIN")
+        self._deferred += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """
+        Leave a transaction block, committing on the outermost exit.
+
+        If the outermost block raised, its transaction is rolled back
+        instead, so no half-finished set of changes is kept. Changes already
+        committed by :meth:`flush` inside the block stay committed.
+        """
+        self._deferred -= 1
+        if self._deferred:
+            return
+        if exc_type is None:
+            self.flush()
+        elif self._conn.in_transaction:
+            self._conn.execute("ROLLBACK")
+
+    def flush(self) -> None:
+        """
+        Commit the open transaction, if any.
+
+        Inside a transaction block a new transaction is started right away,
+        so later changes in the block are still grouped.
+        """
+        if self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+            if self._deferred:
+                self._conn.execute("BEGIN")
+
+    def close(self) -> None:
+        """
+        Commit pending changes and close the database connection.
+        """
+        self.flush()
+        self._conn.close()
+
+    def save_item(self, item: StudyItem) -> None:
+        """
+        Insert or update a StudyItem.
+
+        Args:
+            item (StudyItem): The study item to be stored.
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO items (id, title, notes, created_at) "
+            "VALUES (:id, :title, :notes, :created_at)",
+            item.to_dict(),
+        )
+
+    def load_items(self) -> List[StudyItem]:
+        """
+        Retrieve all StudyItem objects.
+
+        Returns:
+            List[StudyItem]: All stored study items, in insertion order.
+        """
+        rows = self._conn.execute("SELECT * FROM items ORDER BY rowid")
+        return list(StudyItem._bulk_from_dicts(rows))
+
+    def load_items_by_id(self) -> Dict[str, StudyItem]:
+        """
+        Retrieve all StudyItem objects keyed by their identifier.
+
+        Returns:
+            Dict[str, StudyItem]: Mapping of study item IDs to StudyItem
+                                  instances.
+        """
+        return {it.id: it for it in self.load_items()}
+
+    def title_exists(self, title: str) -> bool:
+        """
+        Check whether a StudyItem with the given title is stored.
+
+        Args:
+            title (str): Title to look for.
+
+        Returns:
+            bool: True if an item with this title exists; otherwise False.
+        """
+        cur = self._conn.execute(
+            "SELECT 1 FROM items WHERE title = ? LIMIT 1", (title,)
+        )
+        return cur.fetchone() is not None
+
+    def save_review(self, review: ReviewItem) -> None:
+        """
+        Append a ReviewItem record.
+
+        Args:
+            review (ReviewItem): The review entry to be stored.
+        """
+        self.save_reviews([review])
+
+    def save_reviews(self, reviews: List[ReviewItem]) -> None:
+        """
+        Append several ReviewItem records with a single ``executemany``.
+
+        Args:
+            reviews (List[ReviewItem]): The review entries to be stored.
+        """
+        self._conn.executemany(
+            "INSERT INTO reviews (item_id, review_date) "
+            "VALUES (:item_id, :review_date)",
+            [review.to_dict() for review in reviews],
+        )
+
+    def load_reviews(self) -> List[ReviewItem]:
+        """
+        Retrieve all ReviewItem objects.
+
+        Returns:
+            List[ReviewItem]: All stored reviews.
+        """
+        return list(self.iter_reviews())
+
+    def iter_reviews(self) -> Iterator[ReviewItem]:
+        """
+        Yield stored ReviewItem objects one at a time, streamed from a cursor.
+
+        Yields:
+            ReviewItem: Each stored review, in insertion order.
+        """
+        rows = self._conn.execute("SELECT * FROM reviews ORDER BY rowid")
+        yield from ReviewItem._bulk_from_dicts(rows)
+
+    def load_all(self) -> Tuple[Dict[str, StudyItem], List[ReviewItem]]:
+        """
+        Retrieve all StudyItem and ReviewItem objects together.
+
+        Returns:
+            Tuple[Dict[str, StudyItem], List[ReviewItem]]: A mapping of study
+                item IDs to StudyItem instances and the list of all reviews.
+        """
+        return self.load_items_by_id(), self.load_reviews()
+
+    def load_review_for_item(self, item_id: str) -> ReviewItem | None:
+        """
+        Retrieve the first review associated with a specific study item.
+
+        Args:
+            item_id (str): Identifier of the study item.
+
+        Returns:
+            ReviewItem | None: The matching ReviewItem if found;
+                               otherwise None.
+        """
+        row = self._conn.execute(
+            "SELECT * FROM reviews WHERE item_id = ? ORDER BY rowid LIMIT 1",
+            (item_id,),
+        ).fetchone()
+        return ReviewItem.from_dict(row) if row else None
+
+    def clear(self) -> None:
+        """
+        Remove all stored items and reviews.
+        """
+        with self:
+            self._conn.execute("DELETE FROM reviews")
+            self._conn.execute("DELETE FROM items")
+
+    def remove_reviews_for_item(self, item_id: str) -> None:
+        """
+        Delete all review records associated with a given study item.
+
+        Args:
+            item_id (str): Identifier of the study item whose reviews
+                           should be removed.
+        """
+        self._conn.execute("DELETE FROM reviews WHERE item_id = ?", (item_id,))
+
+    def remove_item_by_title(self, title: str) -> None:
+        """
+        Remove a study item by its title and delete associated reviews.
+
+        Args:
+            title (str): Title of the study item to be removed.
+        """
+        self.remove_items_by_title(title)
+
+    def remove_items_by_title(self, title: str) -> int:
+        """
+        Remove every study item with the given title and all their reviews.
+
+        Args:
+            title (str): Title of the study items to be removed.
+
+        Returns:
+            int: The number of study items removed.
+        """
+        with self:
+            self._conn.execute(
+                "DELETE FROM reviews WHERE item_id IN "
+                "(SELECT id FROM items WHERE title = ?)",
+                (title,),
+            )
+            cur = self._conn.execute("DELETE FROM items WHERE title = ?", (title,))
+        return cur.rowcount
+
+    def as_memory(self) -> MemoryStore:
+        """
+        Convert the database contents into an in-memory MemoryStore instance.
+
+        The MemoryStore's dictionaries are filled directly. As with repeated
+        ``save_review`` calls, the last review of each item is kept.
+
+        Returns:
+            MemoryStore: A populated in-memory representation of the data.
+        """
+        ms = MemoryStore()
+        ms._items = self.load_items_by_id()
+        ms._reviews = {r.item_id: r for r in self.iter_reviews()}
+        return ms
@@ -12,13 +12,40 @@ methods used by the loop:
 - ``export_ics(path: str) -> None``]
 - ``clear() -> None``
 - ``remove_item(title: str) -> None``
+- ``flush() -> None``
+
+The ``app`` is also used as a context manager (see :meth:`~jubarte.app.App.__enter__`)
+so store writes are deferred for the whole session.
 
 All messages and prompts are written to stdout; this function is intended for
 use in a terminal and has side effects (printing, reading stdin, and calling
 ``app`` methods).
 """
 
-from typing import Any, List
+import os
+import select
+import sys
+from typing import Any, Callable, Dict
+
+
+def _input_pending() -> bool:
+    """Return whether more input can be read from stdin without blocking.
+
+    Only the underlying file descriptor is polled, so lines already buffered
+    by ``sys.stdin`` are not seen; the answer errs towards False. On Windows,
+    where ``select`` does not work on console handles, and when stdin has no
+    file descriptor, False is returned.
+
+    Returns:
+        bool: True if stdin is readable (or at end of file) right now.
+    """
+    if os.name == "nt":
+        return False
+    try:
+        ready, _, _ = select.select([sys.stdin], [], [], 0)
+    except (OSError, ValueError):
+        return False
+    return bool(ready)
 
 
 def interactive_loop(app: Any) -> None:
@@ -29,6 +56,11 @@ def interactive_loop(app: Any) -> None:
     corresponding method on ``app``. When the user sends EOF (Ctrl+D) or
     interrupts (Ctrl+C) the loop exits gracefully.
 
+    The session runs inside ``with app:``, so store writes are deferred.
+    Pending writes are flushed whenever the loop is about to wait for input
+    and when it exits; commands fed faster than that, e.g. from a pipe, are
+    written together.
+
     Supported commands:
       - ``help``: show available commands.
       - ``add <title>``: create a new study item with the given title.
@@ -48,8 +80,130 @@ def interactive_loop(app: Any) -> None:
         None: The function runs until the user exits and does not return a
         value.
     """
+    # Imported here rather than at module level, as app.py imports this
+    # module for every CLI command.
+    try:
+        import readline  # noqa: F401 - enables line editing and history for input()
+    except ImportError:  # pragma: no cover - not available on Windows
+        pass
+
     print("Jubarte — interactive mode. Type 'help' for commands.")
+    with app:
+        _run_loop(app)
+
+
+def _parse_title(rest: str) -> str:
+    """Return the title given as the argument of ``add`` or ``remove``.
+
+    The argument is used as typed, internal spacing included. A title may
+    also be quoted, so arguments containing a quote are tokenized with
+    :func:`shlex.split` and the words rejoined; text that shlex rejects
+    (e.g. the lone apostrophe in ``add Newton's laws``) is used unchanged.
+
+    Args:
+        rest: Everything after the command name, stripped.
+
+    Returns:
+        str: The title, possibly empty.
+    """
+    if "'" in rest or '"' in rest:
+        import shlex
+
+        try:
+            return " ".join(shlex.split(rest))
+        except ValueError:
+            pass
+    return rest
+
+
+def _cmd_help(app: Any, rest: str) -> None:
+    """Handle ``help``: list the available commands."""
+    print("commands: add <title>, list, export <file>, clear, remove <title>, exit")
+
+
+def _cmd_exit(app: Any, rest: str) -> bool:
+    """Handle ``exit``: signal the loop to stop."""
+    return True
+
+
+def _cmd_add(app: Any, rest: str) -> None:
+    """Handle ``add <title>``: create a study item."""
+    title = _parse_title(rest)
+    if not title:
+        print("Title is required")
+        return
+    item = app.add_item(title)
+    print(f"Added: {item.title}")
+
+
+def _cmd_list(app: Any, rest: str) -> None:
+    """Handle ``list``: print items with their review dates in one write."""
+    items = app.list_items()
+    if not items:
+        print("No items found.")
+    else:
+        print(
+            "\n".join(
+                f"{it.title} | Review date: {review.review_date.isoformat()[:10]}"
+                for it, review in items
+            )
+        )
+
+
+def _cmd_export(app: Any, rest: str) -> None:
+    """Handle ``export <file.ics>``: write all reviews to a calendar file."""
+    if not rest:
+        print("Usage: export <file.ics>")
+        return
+    app.export_ics(rest.split(None, 1)[0])
+
+
+def _cmd_clear(app: Any, rest: str) -> None:
+    """Handle ``clear``: remove all items and reviews."""
+    app.clear()
+    print("Cleared all items and reviews.")
+
+
+def _cmd_remove(app: Any, rest: str) -> None:
+    """Handle ``remove <title>``: remove an item by its title."""
+    title = _parse_title(rest)
+    if not title:
+        print("Usage: remove <title>")
+        return
+    app.remove_item(title)
+    print(f"Removed item with title: {title}")
+
+
+def _cmd_unknown(app: Any, rest: str) -> None:
+    """Handle any command not in :data:`_DISPATCH`."""
+    print("Unknown command. Type 'help'.")
+
+
+_DISPATCH: Dict[str, Callable[[Any, str], bool | None]] = {
+    "help": _cmd_help,
+    "exit": _cmd_exit,
+    "add": _cmd_add,
+    "list": _cmd_list,
+    "export": _cmd_export,
+    "clear": _cmd_clear,
+    "remove": _cmd_remove,
+}
+
+
+def _run_loop(app: Any) -> None:
+    """Read and execute commands until the user exits.
+
+    Each line is split once, at its first run of whitespace, into the command
+    name and the rest of the line, which is passed to the handler as a string;
+    handlers split it further only if they need to. Commands are looked up
+    in :data:`_DISPATCH`, and a handler returning True ends the loop.
+
+    Args:
+        app: The application object passed to :func:`interactive_loop`.
+    """
     while True:
+        if not _input_pending():
+            app.flush()
         try:
             line = input("jubarte> ").strip()
         except (EOFError, KeyboardInterrupt):
@@ -57,46 +211,9 @@ def interactive_loop(app: Any) -> None:
             break
         if not line:
             continue
-        user_input: List[str] = line.split()
-        cmd = user_input[0]
-        args = user_input[1:]
-
-        if cmd == "help":
-            print(
-                "commands: add <title>, list, export <file>, clear, remove <title>, exit"
-            )
-        elif cmd == "exit":
+        parts = line.split(None, 1)
+        cmd = parts[0]
+        rest = parts[1] if len(parts) > 1 else ""
+        handler = _DISPATCH.get(cmd, _cmd_unknown)
+        if handler(app, rest):
             break
-        elif cmd == "add":
-            title = " ".join(args)
-            if not title:
-                print("Title is required")
-                continue
-            item = app.add_item(title)
-            print(f"Added: {item.title}")
-        elif cmd == "list":
-            items = app.list_items()
-            if not items:
-                print("No items found.")
-            else:
-                for it, review in items:
-                    print(
-                        f"{it.title} | Review date: {review.review_date.isoformat()[:10]}"
-                    )
-        elif cmd == "export":
-            if len(args) < 1:
-                print("Usage: export <file.ics>")
-                continue
-            app.export_ics(args[0])
-        elif cmd == "clear":
-            app.clear()
-            print("Cleared all items and reviews.")
-        elif cmd == "remove":
-            if len(args) < 1:
-                print("Usage: remove <title>")
-                continue
-            title = " ".join(args)
-            app.remove_item(title)
-            print(f"Removed item with title: {title}")
-        else:
-            print("Unknown command. Type 'help'.")
@@ -19,7 +19,8 @@ Options:
 Workflow:
     1. Runs `pre-commit run --all-files` up to 3 times (default)
        to allow auto-fixes to stabilize.
-    2. Aborts if pre-commit keeps modifying files.
+    2. Aborts if pre-commit keeps modifying files, or as soon as a run
+       fails without modifying anything (re-running would fail again).
     3. Stages all changes (`git add .`).
     4. Creates a commit with the provided message.
     5. Optionally pushes to the current remote branch.
@@ -30,6 +31,7 @@ Requirements:
     - poetry
 """
 
+import hashlib
 import subprocess
 import sys
 
@@ -42,7 +44,37 @@ def run(cmd: list[str], allow_fail: bool = False) -> int:
     return result.returncode
 
 
+# Object name of git's empty tree, used as the diff base before the first commit.
+EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+
+def worktree_fingerprint() -> str:
+    """Hash the uncommitted changes, including untracked files."""
+    has_head = (
+        subprocess.run(
+            ["git", "rev-parse", "--verify", "-q", "HEAD"],
+            stdout=subprocess.DEVNULL,
+        ).returncode
+        == 0
+    )
+    base = "HEAD" if has_head else EMPTY_TREE
+    digest = hashlib.sha256(subprocess.check_output(["git", "diff", "--binary", base]))
+    untracked = subprocess.check_output(
+        ["git", "ls-files", "-z", "--others", "--exclude-standard"]
+    )
+    if untracked:
+        digest.update(untracked)
+        digest.update(
+            subprocess.check_output(
+                ["git", "hash-object", "--stdin-paths"],
+                input=untracked.replace(b"\0", b"\n"),
+            )
+        )
+    return digest.hexdigest()
+
+
 def run_precommit_until_clean(max_runs: int = 3):
+    before = worktree_fingerprint()
     for i in range(max_runs):
         print(f"\n🔍 pre-commit run ({i + 1}/{max_runs})")
         code = run(["pre-commit", "run", "--all-files"], allow_fail=True)
@@ -51,6 +83,13 @@ def run_precommit_until_clean(max_runs: int = 3):
             print("✅ pre-commit clean")
             return
 
+        after = worktree_fingerprint()
+        if after == before:
+            raise RuntimeError(
+                "❌ pre-commit failed without fixing anything, aborting."
+            )
+        before = after
+
     raise RuntimeError("❌ pre-commit keeps modifying files, aborting.")
 
 
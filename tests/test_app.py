@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from jubarte.app import App
+from jubarte.core.scheduler import SimpleSpacedScheduler
+from jubarte.models import ReviewItem
+from jubarte.storage.file_store import FileStore
+from jubarte.storage.sqlite_store import SQLiteStore
+
+REVIEWS_PER_ITEM = len(SimpleSpacedScheduler.BASE_INTERVALS)
+
+
+@pytest.fixture(params=[FileStore, SQLiteStore])
+def open_store(request, tmp_path):
+    """Return a function opening a store of the parametrized type on one path."""
+    suffix = ".sqlite3" if request.param is SQLiteStore else ".json"
+    path = tmp_path / f"data{suffix}"
+    opened = []
+
+    def open_store():
+        store = request.param(path)
+        opened.append(store)
+        return store
+
+    yield open_store
+    for store in opened:
+        if isinstance(store, SQLiteStore):
+            store.close()
+
+
+def test_add_item(open_store):
+    app = App(store=open_store())
+    item = app.add_item("Algebra", "chapter 1")
+
+    other = open_store()
+    assert other.load_items() == [item]
+    assert other.title_exists("Algebra")
+    assert len(other.load_reviews()) == REVIEWS_PER_ITEM
+    assert other.load_review_for_item(item.id).item_id == item.id
+
+
+def test_duplicate_title_is_rejected(open_store):
+    app = App(store=open_store())
+    app.add_item("Algebra")
+    with pytest.raises(ValueError):
+        app.add_item("Algebra")
+    assert len(open_store().load_items()) == 1
+
+
+def test_list_items_and_due_today(open_store):
+    app = App(store=open_store())
+    due = app.add_item("Due")
+    app.add_item("Later")
+    app.store.save_review(ReviewItem(due.id, datetime.now(timezone.utc)))
+
+    assert len(app.list_items()) == 2 * REVIEWS_PER_ITEM + 1
+    assert [item.title for item, _ in app.list_items(due_only=True)] == ["Due"]
+
+
+def test_export_ics(open_store, tmp_path, capsys):
+    app = App(store=open_store())
+    out = tmp_path / "reviews.ics"
+    app.export_ics(str(out))
+    assert capsys.readouterr().out == "No reviews to export.\n"
+    assert not out.exists()
+
+    app.add_item("Algebra")
+    app.export_ics(str(out))
+    assert capsys.readouterr().out == f"Exported: {out}\n"
+    assert out.read_text().count("BEGIN:VEVENT") == REVIEWS_PER_ITEM
+
+
+def test_remove_items_by_title_returns_count(open_store):
+    app = App(store=open_store())
+    app.add_item("Gone")
+    app.add_item("Kept")
+
+    assert app.remove_items_by_title("Gone") == 1
+    assert app.remove_items_by_title("Gone") == 0
+    other = open_store()
+    assert [item.title for item in other.load_items()] == ["Kept"]
+    assert len(other.load_reviews()) == REVIEWS_PER_ITEM
+
+
+def test_clear(open_store):
+    app = App(store=open_store())
+    app.add_item("Algebra")
+    app.clear()
+
+    other = open_store()
+    assert other.load_items() == []
+    assert other.load_reviews() == []
+
+
+def test_changes_are_written_when_the_with_block_exits(open_store):
+    app = App(store=open_store())
+    with app:
+        app.add_item("Deferred")
+        assert app.store.title_exists("Deferred")
+        assert open_store().load_items() == []
+    assert [item.title for item in open_store().load_items()] == ["Deferred"]
+
+
+def test_flush_inside_with_block_writes_right_away(open_store):
+    app = App(store=open_store())
+    with app:
+        app.add_item("First")
+        app.flush()
+        assert [item.title for item in open_store().load_items()] == ["First"]
+        app.add_item("Second")
+    assert len(open_store().load_items()) == 2
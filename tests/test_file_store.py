@@ -0,0 +1,233 @@
+import json
+import os
+import stat
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from jubarte.models import ReviewItem, new_item
+from jubarte.storage import file_store
+from jubarte.storage.file_store import FileStore
+
+WHEN = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def titles(store):
+    return sorted(item.title for item in store.load_items())
+
+
+def test_reopen_replays_snapshot_and_journal(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    first = new_item("first")
+    store.save_item(first)
+    store.save_review(ReviewItem(first.id, WHEN))
+    with store._locked():
+        store._compact()
+    second = new_item("second", "notes")
+    store.save_item(second)
+    store.save_review(ReviewItem(second.id, WHEN))
+    store.remove_reviews_for_item(first.id)
+
+    reopened = FileStore(path)
+    assert titles(reopened) == ["first", "second"]
+    assert reopened.load_items_by_id()[second.id].notes == "notes"
+    assert reopened.load_reviews() == [ReviewItem(second.id, WHEN)]
+    assert reopened.load_review_for_item(first.id) is None
+
+
+def test_torn_trailing_line_is_truncated(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    store.save_item(new_item("kept"))
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"seq": 99, "op"')
+
+    reopened = FileStore(path)
+    assert titles(reopened) == ["kept"]
+    assert reopened.journal_path.read_bytes().endswith(b"\n")
+    reopened.save_item(new_item("after"))
+    assert titles(FileStore(path)) == ["after", "kept"]
+
+
+def test_crash_before_journal_truncate_does_not_apply_twice(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    item = new_item("once")
+    store.save_item(item)
+    store.save_reviews([ReviewItem(item.id, WHEN), ReviewItem(item.id, WHEN)])
+    journal = store.journal_path.read_bytes()
+    with store._locked():
+        store._compact()
+    assert store.journal_path.stat().st_size == 0
+    store.journal_path.write_bytes(journal)
+
+    reopened = FileStore(path)
+    assert titles(reopened) == ["once"]
+    assert len(reopened.load_reviews()) == 2
+
+
+def test_journal_is_compacted_past_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_store, "_COMPACT_MIN_BYTES", 1024)
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    for n in range(50):
+        store.save_item(new_item(f"item {n}", "x" * 50))
+
+    assert store.journal_path.stat().st_size <= 1024
+    assert json.loads(path.read_bytes())["seq"] > 0
+    assert len(FileStore(path).load_items()) == 50
+
+
+def test_legacy_indented_file_with_iso_timestamps(tmp_path):
+    path = tmp_path / "data.json"
+    legacy = {
+        "items": [
+            {
+                "id": "a",
+                "title": "Legacy",
+                "notes": "",
+                "created_at": WHEN.isoformat(),
+            }
+        ],
+        "reviews": [{"item_id": "a", "review_date": WHEN.isoformat()}],
+    }
+    path.write_text(json.dumps(legacy, indent=2))
+
+    store = FileStore(path)
+    assert store.load_items()[0].created_at == WHEN
+    assert store.load_reviews() == [ReviewItem("a", WHEN)]
+    store.save_item(new_item("new"))
+    assert titles(FileStore(path)) == ["Legacy", "new"]
+
+
+def test_deferred_flush_keeps_other_store_changes(tmp_path):
+    path = tmp_path / "data.json"
+    a = FileStore(path)
+    b = FileStore(path)
+    with a:
+        a.save_item(new_item("from a"))
+        b.save_item(new_item("from b"))
+
+    assert titles(FileStore(path)) == ["from a", "from b"]
+    assert titles(b) == ["from a", "from b"]
+
+
+def test_deferred_flush_after_other_store_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_store, "_COMPACT_MIN_BYTES", 0)
+    path = tmp_path / "data.json"
+    a = FileStore(path)
+    b = FileStore(path)
+    a.load_items()
+    with b:
+        b.save_item(new_item("from b"))
+        for n in range(3):
+            a.save_item(new_item(f"from a {n}"))
+
+    expected = ["from a 0", "from a 1", "from a 2", "from b"]
+    assert titles(FileStore(path)) == expected
+    assert titles(a) == expected
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_snapshot_keeps_the_file_mode(tmp_path):
+    path = tmp_path / "data.json"
+    umask = os.umask(0)
+    os.umask(umask)
+    store = FileStore(path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    path.chmod(0o640)
+    store.save_item(new_item("kept"))
+    with store._locked():
+        store._compact()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_jsonl_data_file_keeps_its_items(tmp_path):
+    path = tmp_path / "store.jsonl"
+    FileStore(path).save_item(new_item("kept"))
+    assert titles(FileStore(path)) == ["kept"]
+
+
+def test_files_differing_in_suffix_have_separate_journals(tmp_path):
+    data = FileStore(tmp_path / "data.json")
+    backup = FileStore(tmp_path / "data.bak")
+    data.save_item(new_item("data"))
+    backup.save_item(new_item("backup"))
+
+    assert data.journal_path != backup.journal_path
+    assert titles(FileStore(tmp_path / "data.json")) == ["data"]
+    assert titles(FileStore(tmp_path / "data.bak")) == ["backup"]
+
+
+def test_journal_name_is_rejected_as_data_file(tmp_path):
+    with pytest.raises(ValueError):
+        FileStore(tmp_path / "data.json.journal")
+
+
+def test_renamed_item_leaves_the_title_index(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    item = new_item("old title")
+    twin = new_item("old title")
+    store.save_item(item)
+    store.save_item(twin)
+    assert store.title_exists("old title")
+
+    store.save_item(replace(item, title="new title"))
+    assert store.title_exists("old title")
+    assert store.title_exists("new title")
+    store.save_item(replace(twin, title="other title"))
+    assert not store.title_exists("old title")
+
+    reopened = FileStore(path)
+    assert not reopened.title_exists("old title")
+    assert titles(reopened) == ["new title", "other title"]
+    assert reopened.remove_items_by_title("new title") == 1
+
+
+def test_identical_save_is_not_journaled(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    item = new_item("same", "notes")
+    store.save_item(item)
+    size = store.journal_path.stat().st_size
+
+    store.save_item(item)
+    store.save_item(replace(item))
+    assert store.journal_path.stat().st_size == size
+    store.save_item(replace(item, notes="changed"))
+    assert store.journal_path.stat().st_size > size
+    assert FileStore(path).load_items() == [replace(item, notes="changed")]
+
+
+def test_clear_in_deferred_block_then_add_keeps_only_the_new_item(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    store.save_item(new_item("old"))
+    with store:
+        store.save_item(new_item("queued"))
+        store.clear()
+        store.save_item(new_item("new"))
+        assert not store.title_exists("old")
+    assert titles(store) == ["new"]
+    assert titles(FileStore(path)) == ["new"]
+
+
+def test_clear_of_empty_store_is_not_journaled(tmp_path):
+    store = FileStore(tmp_path / "data.json")
+    store.clear()
+    assert store.journal_path.stat().st_size == 0
+
+
+def test_item_ids_are_interned(tmp_path):
+    path = tmp_path / "data.json"
+    store = FileStore(path)
+    item = new_item("interned")
+    store.save_item(item)
+    store.save_review(ReviewItem(item.id, WHEN))
+
+    items, reviews = FileStore(path).load_all()
+    assert reviews[0].item_id is next(iter(items.values())).id
@@ -0,0 +1,93 @@
+import re
+from datetime import datetime, timezone
+
+from jubarte.export.ics_exporter import ICSExporter
+from jubarte.models import ReviewItem, StudyItem
+
+CREATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def export(tmp_path, reviews, items):
+    path = tmp_path / "out" / "reviews.ics"
+    ICSExporter().export(reviews, items, path)
+    return path.read_bytes()
+
+
+def masked(raw):
+    text = raw.decode("utf-8")
+    text = re.sub(r"-[0-9a-f]{32}@jubarte", "-<uid>@jubarte", text)
+    return re.sub(r"DTSTAMP:\d{8}T\d{6}Z", "DTSTAMP:<dtstamp>", text)
+
+
+def test_golden_output(tmp_path):
+    items = {
+        "a": StudyItem("a", "x" * 59, "back\\slash, comma; semi\r\nnext", CREATED),
+        "b": StudyItem("b", "y" * 60, "", CREATED),
+    }
+    reviews = [
+        ReviewItem("b", datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)),
+        ReviewItem("ghost", datetime(2026, 2, 1, 8, 0, tzinfo=timezone.utc)),
+        ReviewItem("a", datetime(2026, 1, 2, 9, 15, 30, tzinfo=timezone.utc)),
+    ]
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//jubarte//EN",
+        "BEGIN:VEVENT",
+        "UID:a-<uid>@jubarte",
+        "DTSTAMP:<dtstamp>",
+        "DTSTART:20260102T091530Z",
+        "SUMMARY:Review: " + "x" * 59,
+        r"DESCRIPTION:back\\slash\, comma\; semi\nnext",
+        "END:VEVENT",
+        "BEGIN:VEVENT",
+        "UID:ghost-<uid>@jubarte",
+        "DTSTAMP:<dtstamp>",
+        "DTSTART:20260201T080000Z",
+        "SUMMARY:Review: ghost",
+        "DESCRIPTION:",
+        "END:VEVENT",
+        "BEGIN:VEVENT",
+        "UID:b-<uid>@jubarte",
+        "DTSTAMP:<dtstamp>",
+        "DTSTART:20260301T123000Z",
+        "SUMMARY:Review: " + "y" * 59,
+        " y",
+        "DESCRIPTION:",
+        "END:VEVENT",
+        "END:VCALENDAR",
+    ]
+    assert masked(export(tmp_path, reviews, items)) == "\r\n".join(lines) + "\r\n"
+
+
+def test_lines_end_with_crlf(tmp_path):
+    items = {"a": StudyItem("a", "t", "one\ntwo\rthree", CREATED)}
+    reviews = [ReviewItem("a", CREATED)]
+
+    raw = export(tmp_path, reviews, items)
+    assert raw.endswith(b"\r\n")
+    assert raw.count(b"\n") == raw.count(b"\r\n")
+    assert b"DESCRIPTION:one\\ntwo\\nthree\r\n" in raw
+
+
+def test_long_lines_are_folded_into_75_character_chunks(tmp_path):
+    items = {"a": StudyItem("a", "é" * 200, "n" * 300, CREATED)}
+    reviews = [ReviewItem("a", CREATED)]
+
+    text = export(tmp_path, reviews, items).decode("utf-8")
+    lines = text.split("\r\n")[:-1]
+    assert all(len(line.removeprefix(" ")) <= 75 for line in lines)
+    assert sum(line.startswith(" ") for line in lines) == 2 + 4
+    unfolded = text.replace("\r\n ", "")
+    assert "SUMMARY:Review: " + "é" * 200 + "\r\n" in unfolded
+    assert "DESCRIPTION:" + "n" * 300 + "\r\n" in unfolded
+
+
+def test_uids_are_unique(tmp_path):
+    items = {"a": StudyItem("a", "t", "", CREATED)}
+    reviews = [ReviewItem("a", CREATED) for _ in range(3)]
+
+    text = export(tmp_path, reviews, items).decode("utf-8")
+    uids = re.findall(r"^UID:(.*)$", text, re.M)
+    assert len(set(uids)) == 3
@@ -0,0 +1,86 @@
+import builtins
+
+import pytest
+
+from jubarte.app import App
+from jubarte.storage.file_store import FileStore
+from jubarte.ui import interactive
+from jubarte.ui.interactive import _parse_title, _run_loop
+
+
+@pytest.fixture
+def app(tmp_path):
+    return App(store=FileStore(tmp_path / "data.json"))
+
+
+@pytest.fixture
+def run(app, monkeypatch):
+    """Return a function feeding lines to the REPL and returning its output."""
+
+    def run(*lines):
+        feed = iter(lines)
+
+        def fake_input(prompt=""):
+            try:
+                return next(feed)
+            except StopIteration:
+                raise EOFError from None
+
+        monkeypatch.setattr(builtins, "input", fake_input)
+        monkeypatch.setattr(interactive, "_input_pending", lambda: False)
+        _run_loop(app)
+
+    return run
+
+
+def titles(app):
+    return sorted(item.title for item in app.store.load_items())
+
+
+@pytest.mark.parametrize(
+    "rest, title",
+    [
+        ("Algebra", "Algebra"),
+        ("a  b", "a  b"),
+        ('"a  b"', "a  b"),
+        ("'quoted title'", "quoted title"),
+        ("Newton's laws", "Newton's laws"),
+        ("", ""),
+    ],
+)
+def test_parse_title(rest, title):
+    assert _parse_title(rest) == title
+
+
+def test_tab_separates_command_and_argument(app, run, tmp_path):
+    out = tmp_path / "out.ics"
+    run("add\tTabbed title", f"export\t{out}")
+    assert titles(app) == ["Tabbed title"]
+    assert out.exists()
+
+
+def test_added_titles_keep_their_spacing(app, run):
+    run('add "two  spaces"', "add Newton's laws", "add  leading")
+    assert titles(app) == ["Newton's laws", "leading", "two  spaces"]
+
+
+def test_empty_add_and_remove_print_usage(app, run, capsys):
+    run("add", "remove", "add   ")
+    out = capsys.readouterr().out
+    assert out.count("Title is required") == 2
+    assert "Usage: remove <title>" in out
+    assert titles(app) == []
+
+
+def test_remove_and_unknown_commands(app, run, capsys):
+    run("add Keep", "add Drop", "remove Drop", "frobnicate", "list")
+    out = capsys.readouterr().out
+    assert "Removed item with title: Drop" in out
+    assert "Unknown command. Type 'help'." in out
+    assert "Keep | Review date:" in out
+    assert titles(app) == ["Keep"]
+
+
+def test_exit_stops_reading(app, run):
+    run("add First", "exit", "add Never")
+    assert titles(app) == ["First"]
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from jubarte.models import ReviewItem, new_item
+from jubarte.storage.sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "data.sqlite3"
+
+
+def titles(path):
+    store = SQLiteStore(path)
+    try:
+        return [item.title for item in store.load_items()]
+    finally:
+        store.close()
+
+
+def test_block_that_raises_is_rolled_back(path):
+    store = SQLiteStore(path)
+    store.save_item(new_item("before"))
+    with pytest.raises(RuntimeError):
+        with store:
+            store.save_item(new_item("inside"))
+            raise RuntimeError
+    assert [item.title for item in store.load_items()] == ["before"]
+
+    store.save_item(new_item("after"))
+    assert titles(path) == ["before", "after"]
+    store.close()
+
+
+def test_rollback_keeps_changes_flushed_inside_the_block(path):
+    store = SQLiteStore(path)
+    with pytest.raises(RuntimeError):
+        with store:
+            store.save_item(new_item("flushed"))
+            store.flush()
+            store.save_item(new_item("lost"))
+            raise RuntimeError
+    assert titles(path) == ["flushed"]
+    store.close()
+
+
+def test_nested_block_commits_on_outermost_exit(path):
+    store = SQLiteStore(path)
+    with store:
+        with store:
+            store.save_item(new_item("nested"))
+        assert titles(path) == []
+    assert titles(path) == ["nested"]
+    store.close()
+
+
+def test_item_ids_are_interned(path):
+    store = SQLiteStore(path)
+    item = new_item("interned")
+    store.save_item(item)
+    store.save_review(ReviewItem(item.id, datetime.now(timezone.utc)))
+    store.close()
+
+    store = SQLiteStore(path)
+    items, reviews = store.load_all()
+    assert reviews[0].item_id is next(iter(items.values())).id
+    store.close()